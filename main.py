@@ -4,6 +4,12 @@ import numpy as np
 import pyaudio
 import curses
 import time
+import threading
+
+try:
+    import pyfftw
+except ImportError:
+    pyfftw = None
 
 from visualizers.bars import BarsVisualizer
 
@@ -14,23 +20,40 @@ class TerminalAudioVisualizer:
     def __init__(self):
         # Audio setup
         self.CHUNK = 1024 * 2
+        self.FRAMES_PER_BUFFER = self.CHUNK // 4
         self.FORMAT = pyaudio.paInt16
         self.CHANNELS = 1
         self.RATE = 44100
+        self.FPS = 60
         self.pause = False
 
-        self.spectrum = np.zeros(self.CHUNK)
-        self.smoothed_spectrum = np.zeros(self.CHUNK // 2)
-        self.previous_spectrum = np.zeros(self.CHUNK // 2)
-        self.smoothing = 0.8
+        self.spectrum = np.zeros(self.CHUNK // 2, dtype=np.float32)
+        self.smoothed_spectrum = np.zeros(self.CHUNK // 2, dtype=np.float32)
+        self._magnitude = np.zeros(self.CHUNK // 2, dtype=np.float32)
+        self.smoothing = np.float32(0.8)
         self.energy = 0
 
         self.sensitivity = 1.0
         self.sensitivity_step = 0.1
 
+        # Reusable FFT buffers (pyFFTW plan when available, numpy otherwise)
+        if pyfftw is not None:
+            self._fft_in = pyfftw.empty_aligned(self.CHUNK, dtype='float32')
+            self._fft_out = pyfftw.empty_aligned(self.CHUNK // 2 + 1, dtype='complex64')
+            self._fft_plan = pyfftw.FFTW(self._fft_in, self._fft_out, direction='FFTW_FORWARD', flags=('FFTW_MEASURE',))
+        else:
+            self._fft_in = np.empty(self.CHUNK, dtype=np.float32)
+            self._fft_out = None
+            self._fft_plan = None
+
         # Use only BarsVisualizer
         self.visualizer = BarsVisualizer()
 
+        # Rolling window of the most recent CHUNK samples, filled by the stream callback
+        self._audio_buf = np.zeros(self.CHUNK, dtype=np.int16)
+        self._new_samples = 0
+        self._audio_lock = threading.Lock()
+
         # Initialize audio stream
         self.p = pyaudio.PyAudio()
         self.stream = self.p.open(
@@ -39,28 +62,58 @@ class TerminalAudioVisualizer:
             rate=self.RATE,
             input=True,
             output=False,
-            frames_per_buffer=self.CHUNK
+            frames_per_buffer=self.FRAMES_PER_BUFFER,
+            stream_callback=self._on_audio
         )
 
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        samples = np.frombuffer(in_data, dtype=np.int16)[-self.CHUNK:]
+        n = len(samples)
+        if n == 0:
+            return (None, pyaudio.paContinue)
+        with self._audio_lock:
+            self._audio_buf[:-n] = self._audio_buf[n:]
+            self._audio_buf[-n:] = samples
+            self._new_samples += n
+        return (None, pyaudio.paContinue)
+
     def get_audio_data(self):
-        data = np.frombuffer(self.stream.read(self.CHUNK, exception_on_overflow=False), dtype=np.int16)
-        spectrum = np.abs(np.fft.fft(data)[:self.CHUNK // 2])
-        spectrum = spectrum / (128 * self.CHUNK)
-        self.previous_spectrum = self.smoothed_spectrum
-        self.smoothed_spectrum = self.previous_spectrum * self.smoothing + spectrum * (1 - self.smoothing)
-        adjusted_spectrum = self.smoothed_spectrum * self.sensitivity
-        self.energy = np.mean(adjusted_spectrum[:self.CHUNK//4]) * 2
-        return adjusted_spectrum
+        with self._audio_lock:
+            new_samples = self._new_samples
+            self._new_samples = 0
+            if new_samples:
+                np.copyto(self._fft_in, self._audio_buf)
+        # Only blend when new audio arrived, so the decay rate tracks audio time rather than frame rate
+        if new_samples:
+            if self._fft_plan is not None:
+                self._fft_plan()
+                spectrum = np.abs(self._fft_out[:self.CHUNK // 2], out=self._magnitude)
+            else:
+                spectrum = np.abs(np.fft.rfft(self._fft_in)[:self.CHUNK // 2]).astype(np.float32, copy=False)
+            # Blend weight equivalent to one `smoothing` step per CHUNK of new samples,
+            # with the FFT normalisation folded in
+            alpha = 1 - self.smoothing ** np.float32(new_samples / self.CHUNK)
+            spectrum *= alpha / (128 * self.CHUNK)
+            self.smoothed_spectrum *= 1 - alpha
+            self.smoothed_spectrum += spectrum
+        # Mean of the low band, scaled by sensitivity, without materialising an adjusted copy
+        low_bins = self.CHUNK // 4
+        self.energy = float(self.smoothed_spectrum[:low_bins].sum()) * (2 * self.sensitivity / low_bins)
+        return np.multiply(self.smoothed_spectrum, self.sensitivity, out=self.spectrum)
 
     def run(self, stdscr):
         curses.curs_set(0)
         stdscr.timeout(0)
         stdscr.erase()
+        frame_period = 1 / self.FPS
+        next_frame = time.perf_counter()
 
         try:
             while True:
-                try:
-                    key = stdscr.getkey()
+                # getch returns -1 when no key is waiting, so idle frames don't raise
+                ch = stdscr.getch()
+                if 0 <= ch < 256:
+                    key = chr(ch)
                     if key == 'q':
                         break
                     elif key == ' ':
@@ -71,8 +124,6 @@ class TerminalAudioVisualizer:
                         self.sensitivity = max(0.1, self.sensitivity - self.sensitivity_step)
                     else:
                         self.visualizer.handle_keypress(key)
-                except:
-                    pass
 
                 if not self.pause:
                     height, width = stdscr.getmaxyx()
@@ -81,7 +132,14 @@ class TerminalAudioVisualizer:
                     stdscr.addstr(0, 0, f"YTMCLI Visualizer | Spectrum Bars | Sensitivity: {self.sensitivity:.1f} | [Q] Quit | [+/-] Sensitivity | [Space] Pause")
                     self.visualizer.draw(stdscr, spectrum, height, width, self.energy, 0)
                     stdscr.refresh()
-                    time.sleep(0.016)
+
+                # Sleep until the next absolute deadline so draw time doesn't stretch the frame period
+                next_frame += frame_period
+                delay = next_frame - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_frame = time.perf_counter()
         finally:
             self.stream.stop_stream()
             self.stream.close()
@@ -1,29 +1,51 @@
 import curses
+import numpy as np
+
+BLOCK = "█"
 
 class BarsVisualizer:
     def __init__(self):
         self.name = "Spectrum Bars"
         self.bars = 50
         self.boost = 1.5
+        self._row_str = ""
+        self.setup()
+
+    def setup(self):
+        """Precompute the per-bar frequency offsets and boost scale"""
+        i = np.arange(self.bars)
+        self._freq_idx = (i ** 1.3).astype(np.int32) + 1
+        self._boost_scale = (1 + self.boost * (1 - i / self.bars)).astype(np.float32)
+
+    def _bar_heights(self, spectrum, height, count):
+        """Compute the height of every visible bar in one vectorized pass"""
+        freq_index = np.minimum(self._freq_idx[:count], len(spectrum) - 1)
+        amplitude = spectrum[freq_index] * self._boost_scale[:count]
+        return np.minimum(amplitude * ((height - 4) * 3), height - 4).astype(np.int32)
 
     def draw(self, stdscr, spectrum, height, width, energy, hue_offset):
         bar_width = max(1, width // self.bars)
-        for i in range(min(self.bars, width // bar_width)):
-            freq_index = int(i ** 1.3) + 1
-            freq_index = min(freq_index, len(spectrum) - 1)
-            amplitude = spectrum[freq_index] * (1 + self.boost * (1 - i / self.bars))
-
-            bar_height = int(amplitude * (height - 4) * 3)
-            bar_height = min(bar_height, height - 4)
+        count = min(self.bars, width // bar_width)
+        bar_heights = self._bar_heights(spectrum, height, count)
+        if len(self._row_str) != self.bars * bar_width:
+            self._row_str = BLOCK * (self.bars * bar_width)
 
-            for j in range(bar_height):
-                stdscr.addstr(height - 3 - j, i * bar_width, "█" * bar_width, curses.A_BOLD)
+        # Draw row by row, emitting one addstr per run of adjacent bars that reach this row
+        active = np.zeros(count + 2, dtype=np.int8)
+        for level in range(int(bar_heights.max(initial=0))):
+            active[1:-1] = bar_heights > level
+            edges = np.flatnonzero(np.diff(active)).tolist()
+            y = height - 3 - level
+            for start, end in zip(edges[::2], edges[1::2]):
+                stdscr.addstr(y, start * bar_width, self._row_str[:(end - start) * bar_width], curses.A_BOLD)
 
     def handle_keypress(self, key):
         if key == 'b':
             self.boost = max(0.5, min(5.0, self.boost + 0.1))
+            self.setup()
             return True
         elif key == 'B':
             self.boost = max(0.5, min(5.0, self.boost - 0.1))
+            self.setup()
             return True
         return False